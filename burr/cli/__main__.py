@@ -6,6 +6,7 @@ import sys
 import threading
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from importlib.resources import files
 
@@ -86,11 +87,19 @@ def cli():
 def _build_ui():
     cmd = "npm run build --prefix telemetry/ui"
     _command(cmd, capture_output=False)
-    # create a symlink so we can get packages inside it...
-    cmd = "rm -rf burr/tracking/server/build"
-    _command(cmd, capture_output=False)
-    cmd = "cp -R telemetry/ui/build burr/tracking/server/build"
-    _command(cmd, capture_output=False)
+    # copy the build over so we can get packages inside it...
+    # done in-process rather than by spawning `rm`/`cp` (which also don't exist on windows)
+    target = "burr/tracking/server/build"
+    staging, stale = f"{target}.staging", f"{target}.stale"
+    for leftover in (staging, stale):
+        shutil.rmtree(leftover, ignore_errors=True)
+    shutil.copytree("telemetry/ui/build", staging)
+    # swap the fresh build in with renames so the target is never half-populated,
+    # then delete the old one once it's out of the way
+    if os.path.exists(target):
+        os.rename(target, stale)
+    os.rename(staging, target)
+    shutil.rmtree(stale, ignore_errors=True)
 
 
 @cli.command()
@@ -112,6 +121,7 @@ def _run_server(port: int, dev_mode: bool, no_open: bool, no_copy_demo_data: boo
     if not no_copy_demo_data:
         logger.info(f"Copying demo data over to {base_dir}...")
         demo_data_path = files("burr").joinpath("tracking/server/demo_data")
+        to_copy = []
         for top_level in os.listdir(demo_data_path):
             if not os.path.exists(f"{base_dir}/{top_level}"):
                 # this is purely for legacy -- we used to name with `demo_`
@@ -120,8 +130,16 @@ def _run_server(port: int, dev_mode: bool, no_open: bool, no_copy_demo_data: boo
                 ):
                     # in this case we don't need to copy it over, it already exists in the right place...
                     continue
-                logger.info(f"Copying {top_level} over...")
-                shutil.copytree(f"{demo_data_path}/{top_level}", f"{base_dir}/{top_level}")
+                to_copy.append(top_level)
+
+        def _copy_demo(top_level: str):
+            logger.info(f"Copying {top_level} over...")
+            shutil.copytree(f"{demo_data_path}/{top_level}", f"{base_dir}/{top_level}")
+
+        if to_copy:
+            # each demo project is an independent directory, so copy them concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(to_copy))) as executor:
+                list(executor.map(_copy_demo, to_copy))
 
     if not no_open:
         thread = threading.Thread(
@@ -52,16 +52,24 @@ def generate_chatbot_data(data_dir: str, use_traces: bool):
         for prompt in prompts:
             app.run(halt_after=["response"], inputs={"prompt": prompt})
 
+    def _reset_openai_clients():
+        # the clients are cached, so we have to drop them for a change in API key to take effect
+        chatbot_application._get_openai_client.cache_clear()
+        chatbot_application_with_traces._get_openai_client.cache_clear()
+
     for app_id, prompts in sorted(working_conversations.items()):
         _run_conversation(app_id, prompts)
+
     old_api_key = os.environ.get("OPENAI_API_KEY")
     os.environ["OPENAI_API_KEY"] = "fake"
+    _reset_openai_clients()
     for app_id, prompts in sorted(broken_conversations.items()):
         try:
             _run_conversation(app_id, prompts)
         except Exception as e:
             print(f"Got an exception: {e}")
     os.environ["OPENAI_API_KEY"] = old_api_key
+    _reset_openai_clients()
 
 
 def generate_counter_data(data_dir: str = "~/.burr"):
@@ -17,6 +17,7 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     TypeVar,
     Union,
@@ -35,10 +36,10 @@ class Function(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def reads(self) -> list[str]:
+    def reads(self) -> Sequence[str]:
         """Returns the keys from the state that this function reads
 
-        :return: A list of keys
+        :return: A sequence (e.g. list or tuple) of keys
         """
         pass
 
@@ -115,10 +116,10 @@ class Reducer(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def writes(self) -> list[str]:
+    def writes(self) -> Sequence[str]:
         """Returns the keys from the state that this reducer writes.
 
-        :return: A list of keys
+        :return: A sequence (e.g. list or tuple) of keys
         """
         pass
 
@@ -232,10 +233,12 @@ class Condition(Function):
         visitor.visit(tree)
         keys = list(visitor.names)
 
-        # Compile the expression into a callable function
+        # Compile the expression once, up front, so evaluating the condition is just an eval
+        code = compile(tree, "<string>", "eval")
+
         def condition_func(state: State) -> bool:
             __globals = state.get_all()  # we can get all because externally we will subset
-            return eval(compile(tree, "<string>", "eval"), {}, __globals)
+            return eval(code, {}, __globals)
 
         return Condition(keys, condition_func, name=expr)
 
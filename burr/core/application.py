@@ -168,7 +168,7 @@ def _state_update(state_to_modify: State, modified_state: State) -> State:
 
 
 def _validate_reducer_writes(reducer: Reducer, state: State, name: str) -> None:
-    required_writes = reducer.writes
+    required_writes = list(reducer.writes)
     missing_writes = set(reducer.writes) - state.keys()
     if len(missing_writes) > 0:
         raise ValueError(
@@ -194,7 +194,7 @@ def _run_reducer(reducer: Reducer, state: State, result: dict, name: str) -> Sta
     if len(extra_keys) > 0:
         raise ValueError(
             f"Action {name} attempted to write to keys {extra_keys} "
-            f"that it did not declare. It declared: ({reducer.writes})!"
+            f"that it did not declare. It declared: ({list(reducer.writes)})!"
         )
     _validate_reducer_writes(reducer, new_state, name)
     return _state_update(state, new_state)
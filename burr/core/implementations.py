@@ -10,25 +10,29 @@ class Placeholder(Action):
     2. Replace the placeholders with real actions as you see fit
     """
 
+    # The name is assigned after construction (see `with_name`), so these are formatted when raised
+    _RUN_ERROR = (
+        "This is a placeholder action and thus you are unable to run. Please implement: {}!"
+    )
+    _UPDATE_ERROR = (
+        "This is a placeholder action and thus cannot update state. Please implement: {}!"
+    )
+
     def __init__(self, reads: list[str], writes: list[str]):
         super().__init__()
-        self._reads = reads
-        self._writes = writes
+        self._reads = tuple(reads)
+        self._writes = tuple(writes)
 
     def run(self, state: State) -> dict:
-        raise NotImplementedError(
-            f"This is a placeholder action and thus you are unable to run. Please implement: {self}!"
-        )
+        raise NotImplementedError(self._RUN_ERROR.format(self))
 
     def update(self, result: dict, state: State) -> State:
-        raise NotImplementedError(
-            f"This is a placeholder action and thus cannot update state. Please implement: {self}!"
-        )
+        raise NotImplementedError(self._UPDATE_ERROR.format(self))
 
     @property
-    def reads(self) -> list[str]:
+    def reads(self) -> tuple[str, ...]:
         return self._reads
 
     @property
-    def writes(self) -> list[str]:
+    def writes(self) -> tuple[str, ...]:
         return self._writes
@@ -1,7 +1,8 @@
 import json
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 
 from pymongo import MongoClient
 
@@ -10,9 +11,35 @@ from burr.core import persistence, state
 logger = logging.getLogger(__name__)
 
 
+# Clients shared by all persisters, keyed by uri.
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(uri: str) -> MongoClient:
+    """MongoClient is meant to be a per-process singleton (it owns a connection pool and monitor threads),
+    so we share one per uri across persisters."""
+    with _clients_lock:
+        if uri not in _clients:
+            _clients[uri] = MongoClient(uri)
+        return _clients[uri]
+
+
+def close_clients():
+    """Closes all clients shared by `MongoDBPersister` instances. Persisters created afterwards get new ones."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
 class MongoDBPersister(persistence.BaseStatePersister):
     """A class used to represent a MongoDB Persister.
 
+    Persisters with the same uri share a single ``MongoClient`` (available as ``persister.client``).
+    Do not close it directly, as that would break every other persister using it -- call
+    :py:func:`close_clients` (or :py:meth:`close_client`) instead.
+
     Example usage:
 
     .. code-block:: python
@@ -38,9 +65,10 @@ class MongoDBPersister(persistence.BaseStatePersister):
         serde_kwargs: dict = None,
     ):
         """Initializes the MongoDBPersister class."""
-        self.client = MongoClient(uri)
+        self.client = _get_client(uri)
         self.db = self.client[db_name]
         self.collection = self.db[collection_name]
+        self.uri = uri
         self.serde_kwargs = serde_kwargs or {}
 
     def list_app_ids(self, partition_key: str, **kwargs) -> list[str]:
@@ -96,5 +124,11 @@ class MongoDBPersister(persistence.BaseStatePersister):
             }
         )
 
-    def __del__(self):
+    def close_client(self):
+        """Closes the client shared by all persisters with this uri, and evicts it so that
+        persisters created afterwards get a new one."""
+        with _clients_lock:
+            # only evict if it hasn't already been replaced by a newer client
+            if _clients.get(self.uri) is self.client:
+                del _clients[self.uri]
         self.client.close()
@@ -1,18 +1,55 @@
 from burr.integrations import base
 
 try:
-    import psycopg2
+    import psycopg2.pool
 except ImportError as e:
     base.require_plugin(e, ["psycopg2"], "postgresql")
 
 import json
 import logging
-from typing import Literal, Optional
+import os
+import threading
+from typing import Dict, Literal, Optional, Tuple
 
 from burr.core import persistence, state
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by all persisters created through `from_values`, keyed by connection parameters.
+_pools: Dict[Tuple[str, str, str, str, int], "psycopg2.pool.ThreadedConnectionPool"] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(
+    db_name: str, user: str, password: str, host: str, port: int
+) -> "psycopg2.pool.ThreadedConnectionPool":
+    """Gets (or lazily creates) the connection pool for the given connection parameters.
+
+    The maximum number of pooled connections is controlled by the BURR_PG_POOL environment variable
+    (default 8). Once those are all checked out, `from_values` opens dedicated connections instead.
+    """
+    key = (db_name, user, password, host, port)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = psycopg2.pool.ThreadedConnectionPool(
+                minconn=1,
+                maxconn=int(os.environ.get("BURR_PG_POOL", 8)),
+                dbname=db_name,
+                user=user,
+                password=password,
+                host=host,
+                port=port,
+            )
+        return _pools[key]
+
+
+def close_pools():
+    """Closes all connections in all pools created by `PostgreSQLPersister.from_values`."""
+    with _pools_lock:
+        for connection_pool in _pools.values():
+            connection_pool.closeall()
+        _pools.clear()
+
 
 class PostgreSQLPersister(persistence.BaseStatePersister):
     """Class for PostgreSQL persistence of state. This is a simple implementation.
@@ -70,10 +107,22 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         :param port: the port of the PostgreSQL database.
         :param table_name:  the table name to store things under.
         """
-        connection = psycopg2.connect(
-            dbname=db_name, user=user, password=password, host=host, port=port
-        )
-        return cls(connection, table_name)
+        connection_pool = _get_pool(db_name, user, password, host, port)
+        try:
+            connection = connection_pool.getconn()
+        except psycopg2.pool.PoolError:
+            # pool is exhausted (persisters hold their connection for their lifetime) --
+            # fall back to a dedicated connection, which `close()` will close rather than return
+            logger.debug("Connection pool exhausted, opening a dedicated connection.")
+            return cls(
+                psycopg2.connect(
+                    dbname=db_name, user=user, password=password, host=host, port=port
+                ),
+                table_name,
+            )
+        persister = cls(connection, table_name)
+        persister._pool = connection_pool
+        return persister
 
     def __init__(self, connection, table_name: str = "burr_state", serde_kwargs: dict = None):
         """Constructor
@@ -84,6 +133,8 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         self.table_name = table_name
         self.connection = connection
         self.serde_kwargs = serde_kwargs or {}
+        # set if the connection was checked out of a pool (see `from_values`)
+        self._pool = None
 
     def set_serde_kwargs(self, serde_kwargs: dict):
         """Sets the serde_kwargs for the persister."""
@@ -225,9 +276,19 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         )
         self.connection.commit()
 
+    def close(self):
+        """Releases the connection -- returns it to the pool if it came from one, otherwise closes it."""
+        if self.connection is None:
+            return
+        if self._pool is not None and not self._pool.closed:
+            self._pool.putconn(self.connection)
+        else:
+            self.connection.close()
+        self.connection = None
+
     def __del__(self):
-        # closes connection at end when things are being shutdown.
-        self.connection.close()
+        # releases connection at end when things are being shutdown.
+        self.close()
 
 
 if __name__ == "__main__":
@@ -1,42 +1,97 @@
 # try to import to serialize Pandas Objects
 import hashlib
+import logging
 import os
 
+import numpy as np
 import pandas as pd
 
 from burr.core import serde
 
+logger = logging.getLogger(__name__)
+
+# kwargs that only apply to writing (pyarrow.feather.write_feather), so that the same pandas_kwargs
+# can be passed when serializing and deserializing
+_FEATHER_WRITE_ONLY_KWARGS = (
+    "content_hash",
+    "compression",
+    "compression_level",
+    "chunksize",
+    "version",
+)
+
 
 @serde.serialize.register(pd.DataFrame)
 def serialize_pandas_df(value: pd.DataFrame, pandas_kwargs: dict, **kwargs) -> dict:
     """Custom serde for pandas dataframes.
 
-    Saves the dataframe to a parquet file and returns the path to the file.
-    Requires a `path` key in the `pandas_kwargs` dictionary.
+    Saves the dataframe to a feather (Arrow IPC) file and returns the path to the file.
+    Requires a `path` key in the `pandas_kwargs` dictionary. Compression defaults to zstd (level 1),
+    which is considerably cheaper to write/read than parquet for the size of frames kept in state.
+    Pass `compression` (and optionally `compression_level`) in `pandas_kwargs` to override it.
 
     :param value: the pandas dataframe to serialize.
-    :param pandas_kwargs: `path` key is required -- this is the base path to save the parquet file. As \
-    well as any other kwargs to pass to the pandas to_parquet function.
+    :param pandas_kwargs: `path` key is required -- this is the base path to save the feather file (created if \
+    it does not exist). Set `content_hash=True` to include the data (not just the schema) in the file name, so \
+    dataframes with the same schema but different data don't overwrite each other (if any values are unhashable, \
+    e.g. lists or dicts, the name falls back to the schema only). As well as any other kwargs \
+    to pass to the pandas to_feather function.
     :param kwargs:
     :return:
     """
-    hash_object = hashlib.sha256()
-    hash_value = str(value.columns) + str(value.shape) + str(value.dtypes)
-    hash_object.update(hash_value.encode())
+    # blake2b is cheaper than sha256 and 128 bits is plenty to avoid collisions here.
+    # We hash the raw names/shape/dtype codes rather than their (pandas-version dependent) reprs.
+    hash_object = hashlib.blake2b(digest_size=16)
+    hash_object.update("|".join(str(column) for column in value.columns).encode())
+    hash_object.update(np.array(value.shape, dtype=np.int64).tobytes())
+    hash_object.update("|".join(str(dtype) for dtype in value.dtypes).encode())
+    kwargs = pandas_kwargs.copy()
+    if kwargs.pop("content_hash", False):
+        try:
+            # vectorized per-row hashes (uint64), fed to blake2b straight from the array buffer
+            hash_object.update(pd.util.hash_pandas_object(value, index=True).to_numpy())
+        except TypeError:
+            # unhashable cells (e.g. lists/dicts in object columns) -- fall back to the schema-only name
+            logger.warning(
+                "Could not hash the contents of a dataframe with unhashable values, "
+                "falling back to a schema-only file name."
+            )
 
     # Return the hexadecimal representation of the hash
-    file_name = f"df_{hash_object.hexdigest()}.parquet"
-    kwargs = pandas_kwargs.copy()
+    file_name = f"df_{hash_object.hexdigest()}.feather"
     base_path: str = kwargs.pop("path")
+    if "compression" not in kwargs:
+        # the level only applies to our default codec -- e.g. "uncompressed" rejects having one
+        kwargs.update(compression="zstd", compression_level=1)
+    # single call, no exists() check -- safe if several writers create the directory at once
+    os.makedirs(base_path, exist_ok=True)
     saved_to = os.path.join(base_path, file_name)
-    value.to_parquet(path=saved_to, **kwargs)
-    return {serde.KEY: "pandas.DataFrame", "path": saved_to}
+    value.to_feather(saved_to, **kwargs)
+    return {serde.KEY: "pandas.DataFrame.feather", "path": saved_to}
 
 
-@serde.deserializer.register("pandas.DataFrame")
+@serde.deserializer.register("pandas.DataFrame.feather")
 def deserialize_pandas_df(value: dict, pandas_kwargs: dict, **kwargs) -> pd.DataFrame:
     """Custom deserializer for pandas dataframes.
 
+    :param value: the dictionary to pull the path from to load the feather file.
+    :param pandas_kwargs: other args to pass to the pandas read_feather function.
+    :param kwargs:
+    :return: pandas dataframe
+    """
+    kwargs = pandas_kwargs.copy()
+    if "path" in kwargs:
+        # remove this to not clash; we already have the full path.
+        kwargs.pop("path")
+    for key in _FEATHER_WRITE_ONLY_KWARGS:
+        kwargs.pop(key, None)
+    return pd.read_feather(value["path"], **kwargs)
+
+
+@serde.deserializer.register("pandas.DataFrame")
+def deserialize_pandas_df_parquet(value: dict, pandas_kwargs: dict, **kwargs) -> pd.DataFrame:
+    """Deserializer for pandas dataframes saved as parquet by older versions of burr.
+
     :param value: the dictionary to pull the path from to load the parquet file.
     :param pandas_kwargs: other args to pass to the pandas read_parquet function.
     :param kwargs:
@@ -46,4 +101,6 @@ def deserialize_pandas_df(value: dict, pandas_kwargs: dict, **kwargs) -> pd.Data
     if "path" in kwargs:
         # remove this to not clash; we already have the full path.
         kwargs.pop("path")
+    for key in _FEATHER_WRITE_ONLY_KWARGS:
+        kwargs.pop(key, None)
     return pd.read_parquet(value["path"], **kwargs)
@@ -9,7 +9,10 @@ from burr.core import serde
 def register_type_to_pickle(cls):
     """Register a class to be serialized/deserialized using pickle.
 
-    Note: `pickle_kwargs` are passed to the pickle.dumps and pickle.loads functions.
+    Note: `pickle_kwargs` are passed to the pickle.dumps and pickle.loads functions. Pickling defaults to protocol 5.
+    Pass `out_of_band=True` in `pickle_kwargs` to store large buffers (e.g. numpy arrays) out-of-band, in a
+    separate `buffers` list, rather than copying them into the pickle stream. These are memoryviews onto the
+    original data (no copy is made), so persist them before mutating the serialized objects.
 
     This will register the passed in class to be serialized/deserialized using pickle.
 
@@ -36,11 +39,20 @@ def register_type_to_pickle(cls):
         :param kwargs:
         :return: dictionary of serde.KEY and value
         """
-        if pickle_kwargs is None:
-            pickle_kwargs = {}
+        pickle_kwargs = dict(pickle_kwargs or {})
+        pickle_kwargs.setdefault("protocol", 5)
+        if not pickle_kwargs.pop("out_of_band", False):
+            return {
+                serde.KEY: "pickle",
+                "value": pickle.dumps(value, **pickle_kwargs),
+            }
+        buffers = []
+        payload = pickle.dumps(value, buffer_callback=buffers.append, **pickle_kwargs)
         return {
             serde.KEY: "pickle",
-            "value": pickle.dumps(value, **pickle_kwargs),
+            "value": payload,
+            # zero-copy views onto the original data -- only copied when they're written out
+            "buffers": [buffer.raw() for buffer in buffers],
         }
 
     @serde.deserializer.register("pickle")
@@ -52,6 +64,13 @@ def register_type_to_pickle(cls):
         :param kwargs:
         :return: object of type cls
         """
-        if pickle_kwargs is None:
-            pickle_kwargs = {}
-        return pickle.loads(value["value"], **pickle_kwargs)
+        pickle_kwargs = dict(pickle_kwargs or {})
+        # these only apply to serialization
+        pickle_kwargs.pop("protocol", None)
+        pickle_kwargs.pop("out_of_band", None)
+        # copy into bytearrays so that the loaded objects (e.g. numpy arrays) are writable, as they are
+        # when loaded in-band, and don't share memory with whatever the buffers were read from
+        buffers = value.get("buffers")
+        if buffers is not None:
+            buffers = [bytearray(buffer) for buffer in buffers]
+        return pickle.loads(value["value"], buffers=buffers, **pickle_kwargs)
@@ -1,4 +1,5 @@
 # try to import to serialize Pydantic Objects
+import functools
 import importlib
 
 import pydantic
@@ -7,15 +8,33 @@ from burr.core import serde
 
 
 @serde.serialize.register(pydantic.BaseModel)
-def serialize_pydantic(value: pydantic.BaseModel, **kwargs) -> dict:
-    """Uses pydantic to dump the model to a dictionary and then adds the __pydantic_class to the dictionary."""
-    _dict = value.model_dump()
+def serialize_pydantic(value: pydantic.BaseModel, pydantic_kwargs: dict = None, **kwargs) -> dict:
+    """Uses pydantic to dump the model to a dictionary and then adds the __pydantic_class to the dictionary.
+
+    :param value: the pydantic model to serialize.
+    :param pydantic_kwargs: not required. Optional. Passed to `model_dump` -- e.g. `exclude_defaults=True` \
+    leaves out fields at their default values, shrinking the serialized state (they're reapplied on load).
+    :param kwargs:
+    :return: dictionary of the model's fields, serde.KEY, and the class name
+    """
+    if pydantic_kwargs is None:
+        pydantic_kwargs = {}
+    _dict = value.model_dump(**{"mode": "python", **pydantic_kwargs})
     _dict[serde.KEY] = "pydantic"
     # get qualified name of pydantic class. The module name should be fully qualified.
     _dict["__pydantic_class"] = f"{value.__class__.__module__}.{value.__class__.__name__}"
     return _dict
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_pydantic_class(pydantic_class_name: str) -> type:
+    """Imports the pydantic class from its fully qualified name. Cached so we don't hit the import machinery
+    for every object we deserialize."""
+    module_name, class_name = pydantic_class_name.rsplit(".", 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
 @serde.deserializer.register("pydantic")
 def deserialize_pydantic(value: dict, **kwargs) -> pydantic.BaseModel:
     """Deserializes a pydantic object from a dictionary.
@@ -23,7 +42,5 @@ def deserialize_pydantic(value: dict, **kwargs) -> pydantic.BaseModel:
     """
     value.pop(serde.KEY)
     pydantic_class_name = value.pop("__pydantic_class")
-    module_name, class_name = pydantic_class_name.rsplit(".", 1)
-    module = importlib.import_module(module_name)
-    pydantic_class = getattr(module, class_name)
+    pydantic_class = _resolve_pydantic_class(pydantic_class_name)
     return pydantic_class.model_validate(value)
@@ -2,20 +2,43 @@
 Module to help with testing.
 """
 
+import itertools
 import json
+import operator
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # orjson is considerably faster at parsing large test case files, but is optional
+    import orjson
+
+    def _json_loads(data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module used to write the file (e.g. it rejects NaN/Infinity)
+            return json.loads(data)
+
+except ImportError:
+    _json_loads = json.loads
+
+_get_states = operator.itemgetter("input_state", "expected_state")
 
 
 # one way to parameterize tests is to store the serialized state in a json file
 # and then load it for the test.
 def load_test_cases(file_name: str) -> tuple:
     """Load test cases from a json file."""
-    with open(file_name, "r") as f:
-        json_test_cases = json.load(f)
+    with open(file_name, "rb") as f:
+        json_test_cases = _json_loads(f.read())
+    try:
+        test_cases = list(map(_get_states, json_test_cases))
+    except KeyError:
+        # a test case is missing a state -- fall back to None for those, as before
         test_cases = [(tc.get("input_state"), tc.get("expected_state")) for tc in json_test_cases]
-        test_ids = [
-            f"{tc.get('action', 'ACTION_MISSING')}-{tc.get('name', 'NAME_MISSING')}"
-            for tc in json_test_cases
-        ]
+    test_ids = [
+        f"{tc.get('action', 'ACTION_MISSING')}-{tc.get('name', 'NAME_MISSING')}"
+        for tc in json_test_cases
+    ]
     return test_cases, test_ids
 
 
@@ -38,10 +61,12 @@ def pytest_generate_tests(metafunc):
         ]
         all_test_cases = []
         all_test_ids = []
-        for file_name in file_names:
-            test_cases, test_case_ids = load_test_cases(file_name)
-            all_test_cases.extend(test_cases)
-            all_test_ids.extend(test_case_ids)
+        if file_names:
+            # overlap reading/parsing the files -- results come back in marker order
+            with ThreadPoolExecutor(max_workers=min(8, len(file_names))) as executor:
+                loaded = list(executor.map(load_test_cases, file_names))
+            all_test_cases = list(itertools.chain.from_iterable(cases for cases, _ in loaded))
+            all_test_ids = list(itertools.chain.from_iterable(ids for _, ids in loaded))
         if not all_test_cases:
             raise ValueError(
                 f"No test cases could be created for test {metafunc.definition.originalname}."
@@ -1,70 +1,78 @@
 """
 Code courtesy of the FalkorDB.
 """
+from concurrent.futures import ThreadPoolExecutor
 
+# graph name -> (version, schema) -- the schema is expensive to collect and rarely changes
+_schema_cache = {}
 
-# collect graph's schema
-def graph_schema(g):
-    schema = {}
 
-    # ---------------------------------------------------------------------------
-    # process nodes
-    # ---------------------------------------------------------------------------
+def _graph_version(g) -> tuple:
+    """Cheap freshness token for the graph -- node/edge counts change whenever we ingest more data."""
+    node_count = g.query("MATCH (n) RETURN count(n)").result_set[0][0]
+    edge_count = g.query("MATCH ()-[e]->() RETURN count(e)").result_set[0][0]
+    return node_count, edge_count
 
-    nodes = {}
 
-    q = "CALL db.labels()"
-    labels = [x[0] for x in g.query(q).result_set]
+def clear_graph_schema_cache():
+    """Drops all cached schemas, e.g. after modifying the graph in a way that keeps the node/edge counts."""
+    _schema_cache.clear()
 
-    for label in labels:
-        nodes[label] = {}
-        nodes[label]["attributes"] = {}
 
-        q = f"MATCH (n:{label}) RETURN n LIMIT 50"
-        result = g.query(q).result_set
-
-        for row in result:
-            node = row[0]
-            for attr in node.properties:
-                val = node.properties[attr]
-                if attr not in nodes[label]["attributes"]:
-                    nodes[label]["attributes"][attr] = {"type": type(val).__name__}
+# collect graph's schema, reusing the last one collected if the graph has not changed
+def graph_schema(g):
+    version = _graph_version(g)
+    cached = _schema_cache.get(g.name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    schema = _collect_graph_schema(g)
+    _schema_cache[g.name] = (version, schema)
+    return schema
 
-    schema["nodes"] = nodes
 
-    # ---------------------------------------------------------------------------
-    # process relations
-    # ---------------------------------------------------------------------------
+def _node_attributes(g, label: str) -> dict:
+    attributes = {}
+    # sample 50 nodes and let the DB report (attribute, type) pairs, rather than shipping whole nodes
+    q = f"MATCH (n:{label}) WITH n LIMIT 50 UNWIND keys(n) AS k RETURN DISTINCT k, typeOf(n[k])"
+    for attr, attr_type in g.query(q).result_set:
+        if attr not in attributes:
+            attributes[attr] = {"type": attr_type}
+    return {"attributes": attributes}
 
-    edges = {}
 
-    q = "CALL db.relationshiptypes()"
-    rels = [x[0] for x in g.query(q).result_set]
+def _edge_attributes_and_connections(g, r: str) -> dict:
+    attributes = {}
+    q = f"MATCH ()-[e:{r}]->() WITH e LIMIT 50 UNWIND keys(e) AS k RETURN DISTINCT k, typeOf(e[k])"
+    for attr, attr_type in g.query(q).result_set:
+        if attr not in attributes:
+            attributes[attr] = {"type": attr_type}
 
-    for r in rels:
-        edges[r] = {}
-        edges[r]["attributes"] = {}
+    # collect edge endpoints -- a single query per relation type, rather than probing every label pair
+    q = (
+        f"MATCH (s)-[:{r}]->(d) "
+        "UNWIND labels(s) AS src UNWIND labels(d) AS dest "
+        "RETURN DISTINCT src, dest"
+    )
+    # sorted so the schema (and the prompt built from it) is stable across calls
+    connects = sorted({(src, dest) for src, dest in g.query(q).result_set})
+    return {"attributes": attributes, "connects": connects}
 
-        q = f"MATCH ()-[e:{r}]->() RETURN e LIMIT 50"
-        result = g.query(q).result_set
 
-        for row in result:
-            edge = row[0]
-            for attr in edge.properties:
-                val = edge.properties[attr]
-                if attr not in edges[r]["attributes"]:
-                    edges[r]["attributes"][attr] = {"type": type(val).__name__}
+def _collect_graph_schema(g):
+    schema = {}
 
-        edges[r]["connects"] = []
+    q = "CALL db.labels()"
+    labels = [x[0] for x in g.query(q).result_set]
 
-        # collect edge endpoints
-        for src in labels:
-            for dest in labels:
-                q = f"MATCH (:{src})-[:{r}]->(:{dest}) RETURN 1 LIMIT 1"
-                res = g.query(q).result_set
-                if len(res) == 1:
-                    edges[r]["connects"].append((src, dest))
+    q = "CALL db.relationshiptypes()"
+    rels = [x[0] for x in g.query(q).result_set]
 
-    schema["edges"] = edges
+    # the probes are independent read-only queries, so we overlap their round-trips.
+    # The client is backed by a (thread-safe) redis connection pool, so we can share it.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        node_futures = {label: executor.submit(_node_attributes, g, label) for label in labels}
+        edge_futures = {r: executor.submit(_edge_attributes_and_connections, g, r) for r in rels}
+        schema["nodes"] = {label: future.result() for label, future in node_futures.items()}
+        schema["edges"] = {r: future.result() for r, future in edge_futures.items()}
 
     return schema
@@ -12,9 +12,9 @@ logger = logging.getLogger(__name__)
 
 @action(reads=["counter"], writes=["counter"])
 def counter(state: State) -> State:
-    result = {"counter": state["counter"] + 1}
-    print(f"counted to {result['counter']}")
-    return state.update(**result)
+    count = state["counter"] + 1
+    logger.info("counted to %d", count)
+    return state.update(counter=count)
 
 
 def application(
@@ -26,6 +26,10 @@ def application(
 ) -> Application:
     persister = SQLLitePersister("demos.db", "counter")
     persister.initialize()
+    # the persister commits after every step -- WAL + synchronous=NORMAL makes those commits cheap
+    # (no fsync per commit, readers don't block the writer)
+    persister.connection.execute("PRAGMA journal_mode=WAL")
+    persister.connection.execute("PRAGMA synchronous=NORMAL")
     logger.info(
         f"{partition_key} has these prior invocations: {persister.list_app_ids(partition_key)}"
     )
@@ -1,4 +1,5 @@
 import copy
+import functools
 import os
 from typing import List, Optional
 
@@ -39,6 +40,7 @@ def check_safety(state: State) -> State:
     return state.update(safe=result["safe"])
 
 
+@functools.lru_cache
 def _get_openai_client():
     return openai.Client()
 
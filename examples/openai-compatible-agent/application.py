@@ -1,15 +1,22 @@
 import datetime
+import functools
+import time
 
 import burr.core
 from burr.core import Application, State
 from burr.core.action import action
 
 
+@functools.lru_cache(maxsize=1)
+def _time_reply(current_second: int) -> str:
+    # second granularity -- repeated questions within the same second reuse the formatted reply
+    return f"It is currently {datetime.datetime.fromtimestamp(current_second)}"
+
+
 @action(reads=[], writes=[])
 def dummy_bot(state: State, user_input: str):
     if "time" in user_input:
-        current_time = datetime.datetime.now()
-        reply = f"It is currently {current_time}"
+        reply = _time_reply(int(time.time()))
     else:
         reply = "🤖 Ask me about the time"
 
@@ -1,4 +1,6 @@
 import logging
+import os
+import sys
 import time
 import uuid
 from contextlib import asynccontextmanager
@@ -65,4 +67,15 @@ async def create_chat_completion(
 
 
 if __name__ == "__main__":
-    uvicorn.run("server:app", host="127.0.0.1", port=7443, reload=True)
+    if "--dev" in sys.argv:
+        # reload is only supported with a single worker
+        uvicorn.run("server:app", host="127.0.0.1", port=7443, reload=True)
+    else:
+        # uvicorn picks uvloop + httptools automatically when they're installed (uvicorn[standard]).
+        # Each worker runs the lifespan, so each gets its own Burr application.
+        uvicorn.run(
+            "server:app",
+            host="127.0.0.1",
+            port=7443,
+            workers=int(os.environ.get("WORKERS", os.cpu_count() or 1)),
+        )
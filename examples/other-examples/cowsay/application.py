@@ -1,3 +1,4 @@
+import functools
 import random
 import time
 from typing import Tuple
@@ -25,16 +26,23 @@ class CowCantSpeakFast(PostRunStepHook):
             time.sleep(self.sleep_time)
 
 
+@functools.lru_cache(maxsize=128)
+def _render_cow(said: str) -> str:
+    """The cow is drawn relative to the width of the speech bubble, so we can't use a single template --
+    but the phrases come from a small fixed list, so we only render each one once."""
+    return cowsay.get_output_string("cow", said)
+
+
 @action(reads=[], writes=["cow_said"])
 def cow_said(state: State, say_what: list[str]) -> Tuple[dict, State]:
-    said = random.choice(say_what)
-    result = {"cow_said": cowsay.get_output_string("cow", said) if say_what is not None else None}
+    result = {"cow_said": _render_cow(random.choice(say_what)) if say_what is not None else None}
     return result, state.update(**result)
 
 
 @action(reads=[], writes=["cow_should_speak"])
 def cow_should_speak(state: State) -> Tuple[dict, State]:
-    result = {"cow_should_speak": random.randint(0, 3) == 0}
+    # 1 in 4 chance -- random.random() is a single C call, cheaper than randint's python-level range logic
+    result = {"cow_should_speak": random.random() < 0.25}
     return result, state.update(**result)
 
 
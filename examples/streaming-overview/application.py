@@ -1,3 +1,4 @@
+import functools
 from typing import Generator, Optional, Tuple
 
 import openai
@@ -27,6 +28,7 @@ def check_safety(state: State) -> Tuple[dict, State]:
     return result, state.update(safe=result["safe"])
 
 
+@functools.lru_cache
 def _get_openai_client():
     return openai.Client()
 
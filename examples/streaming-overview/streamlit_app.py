@@ -1,4 +1,6 @@
+import time
 import uuid
+from typing import Generator
 
 import application as chatbot_application
 import streamlit as st
@@ -20,9 +22,26 @@ def render_chat_message(chat_item: dict):
             st.write(content)
 
 
+def batched_content(
+    stream: StreamingResultContainer, min_interval: float = 0.05
+) -> Generator[str, None, None]:
+    """Groups streamed tokens so streamlit repaints at most every `min_interval` seconds, rather than once per token."""
+    buffer = []
+    last_flush = time.monotonic()
+    for item in stream:
+        buffer.append(item["response"]["content"])
+        now = time.monotonic()
+        if now - last_flush >= min_interval:
+            yield "".join(buffer)
+            buffer.clear()
+            last_flush = now
+    if buffer:
+        yield "".join(buffer)
+
+
 def render_streaming_chat_message(stream: StreamingResultContainer):
     with st.chat_message("assistant"):
-        st.write_stream(item["response"]["content"] for item in stream)
+        st.write_stream(batched_content(stream))
 
 
 def initialize_app() -> burr.core.Application:
@@ -1,4 +1,5 @@
 """This file is truncated to just the relevant parts for the example."""
+import functools
 from typing import Tuple
 
 import openai
@@ -16,6 +17,7 @@ MODES = {
 }
 
 
+@functools.lru_cache
 def _get_openai_client():
     return openai.Client()
 
@@ -1,3 +1,4 @@
+import functools
 from typing import Optional, Tuple
 
 import openai
@@ -30,6 +31,7 @@ def check_safety(state: State, __tracer: TracerFactory) -> Tuple[dict, State]:
     return result, state.update(safe=result["safe"])
 
 
+@functools.lru_cache
 def _get_openai_client():
     return openai.Client()
 
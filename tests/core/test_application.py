@@ -1,6 +1,7 @@
 import asyncio
 import collections
 import logging
+import re
 import typing
 from typing import Any, Awaitable, Callable, Dict, Generator, Literal, Optional, Tuple
 
@@ -299,6 +300,19 @@ def test__run_reducer_deletes_state():
     assert "count" not in state
 
 
+def test__run_reducer_undeclared_write_with_tuple_writes():
+    """Tests that the error message lists declared writes the same way whether they are a list or tuple"""
+    reducer = PassedInAction(
+        reads=["count"],
+        writes=("count",),
+        fn=...,
+        update_fn=lambda result, state: state.update(count=1, other=2),
+        inputs=[],
+    )
+    with pytest.raises(ValueError, match=re.escape("It declared: (['count'])!")):
+        _run_reducer(reducer, State({"count": 0}), {}, "reducer")
+
+
 async def test__arun_function():
     """Tests that we can run an async function"""
     action = base_counter_action_async
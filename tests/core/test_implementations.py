@@ -6,10 +6,12 @@ from burr.core.implementations import Placeholder
 
 def test_placedholder_action():
     action = Placeholder(reads=["foo"], writes=["bar"]).with_name("test")
-    assert action.reads == ["foo"]
-    assert action.writes == ["bar"]
-    with pytest.raises(NotImplementedError):
+    assert action.reads == ("foo",)
+    assert action.writes == ("bar",)
+    with pytest.raises(
+        NotImplementedError, match="unable to run. Please implement: test: foo -> bar"
+    ):
         action.run(State({}))
 
-    with pytest.raises(NotImplementedError):
+    with pytest.raises(NotImplementedError, match="cannot update state. Please implement: test"):
         action.update({}, State({}))
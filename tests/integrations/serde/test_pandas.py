@@ -7,12 +7,77 @@ def test_serde_of_pandas_dataframe(tmp_path):
     df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
     og = state.State({"df": df})
     serialized = og.serialize(pandas_kwargs={"path": tmp_path})
-    assert serialized["df"][serde.KEY] == "pandas.DataFrame"
+    assert serialized["df"][serde.KEY] == "pandas.DataFrame.feather"
     assert serialized["df"]["path"].startswith(str(tmp_path))
-    assert (
-        "df_a23d165ed4a2b8c6ccf24ac6276e35a9dc312e2828b4d0810416f4d47c614c7f.parquet"
-        in serialized["df"]["path"]
-    )
+    assert "df_fe235e4566115bb0d1cc4d2ea57569d1.feather" in serialized["df"]["path"]
     ng = state.State.deserialize(serialized, pandas_kwargs={"path": tmp_path})
     assert isinstance(ng["df"], pd.DataFrame)
     pd.testing.assert_frame_equal(ng["df"], df)
+
+
+def test_serde_of_pandas_dataframe_creates_path(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    base_path = tmp_path / "nested" / "dir"
+    serialized = state.State({"df": df}).serialize(pandas_kwargs={"path": str(base_path)})
+    assert serialized["df"]["path"].startswith(str(base_path))
+    ng = state.State.deserialize(serialized, pandas_kwargs={"path": str(base_path)})
+    pd.testing.assert_frame_equal(ng["df"], df)
+
+
+def test_serde_of_pandas_dataframe_content_hash(tmp_path):
+    df_1 = pd.DataFrame({"a": [1, 2, 3]})
+    df_2 = pd.DataFrame({"a": [4, 5, 6]})
+    pandas_kwargs = {"path": tmp_path, "content_hash": True}
+    serialized = state.State({"df_1": df_1, "df_2": df_2}).serialize(pandas_kwargs=pandas_kwargs)
+    assert serialized["df_1"]["path"] != serialized["df_2"]["path"]
+    # same data, same file
+    serialized_again = state.State({"df": df_1.copy()}).serialize(pandas_kwargs=pandas_kwargs)
+    assert serialized_again["df"]["path"] == serialized["df_1"]["path"]
+    ng = state.State.deserialize(serialized, pandas_kwargs=pandas_kwargs)
+    pd.testing.assert_frame_equal(ng["df_1"], df_1)
+    pd.testing.assert_frame_equal(ng["df_2"], df_2)
+
+
+def test_deserialize_of_legacy_parquet_dataframe(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    saved_to = str(tmp_path / "df_legacy.parquet")
+    df.to_parquet(path=saved_to)
+    serialized = {"df": {serde.KEY: "pandas.DataFrame", "path": saved_to}}
+    ng = state.State.deserialize(serialized, pandas_kwargs={"path": tmp_path})
+    pd.testing.assert_frame_equal(ng["df"], df)
+
+
+def test_serde_of_pandas_dataframe_compression_override(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    for compression in ["uncompressed", "lz4"]:
+        # the same kwargs are used on both sides -- write-only ones are ignored when reading
+        pandas_kwargs = {"path": tmp_path / compression, "compression": compression}
+        serialized = state.State({"df": df}).serialize(pandas_kwargs=pandas_kwargs)
+        ng = state.State.deserialize(serialized, pandas_kwargs=pandas_kwargs)
+        pd.testing.assert_frame_equal(ng["df"], df)
+
+
+def test_serde_of_pandas_dataframe_compression_level(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    pandas_kwargs = {"path": tmp_path, "compression": "zstd", "compression_level": 3}
+    serialized = state.State({"df": df}).serialize(pandas_kwargs=pandas_kwargs)
+    ng = state.State.deserialize(serialized, pandas_kwargs=pandas_kwargs)
+    pd.testing.assert_frame_equal(ng["df"], df)
+
+
+def test_serde_of_pandas_dataframe_content_hash_unhashable_values(tmp_path):
+    df = pd.DataFrame({"a": [[1, 2], [3]], "b": [{"x": 1}, {"y": 2}]})
+    pandas_kwargs = {"path": tmp_path, "content_hash": True}
+    serialized = state.State({"df": df}).serialize(pandas_kwargs=pandas_kwargs)
+    schema_only = state.State({"df": df}).serialize(pandas_kwargs={"path": tmp_path})
+    assert serialized["df"]["path"] == schema_only["df"]["path"]
+
+
+def test_deserialize_of_legacy_parquet_dataframe_with_compression_override(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    saved_to = str(tmp_path / "df_legacy.parquet")
+    df.to_parquet(path=saved_to)
+    serialized = {"df": {serde.KEY: "pandas.DataFrame", "path": saved_to}}
+    pandas_kwargs = {"path": tmp_path, "compression": "lz4", "compression_level": 1}
+    ng = state.State.deserialize(serialized, pandas_kwargs=pandas_kwargs)
+    pd.testing.assert_frame_equal(ng["df"], df)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from burr.core import serde, state
 from burr.integrations.serde import pickle
 
@@ -16,7 +18,7 @@ def test_serde_of_pickle_object():
     assert serialized == {
         "user": {
             serde.KEY: "pickle",
-            "value": b"\x80\x04\x95Q\x00\x00\x00\x00\x00\x00\x00\x8c\x0btest_pi"
+            "value": b"\x80\x05\x95Q\x00\x00\x00\x00\x00\x00\x00\x8c\x0btest_pi"
             b"ckle\x94\x8c\x04User\x94\x93\x94)\x81\x94}\x94(\x8c\x04na"
             b"me\x94\x8c\x08John Doe\x94\x8c\x05email\x94\x8c\x14john"
             b".doe@example.com\x94ub.",
@@ -27,3 +29,43 @@ def test_serde_of_pickle_object():
     assert isinstance(ng["user"], User)
     assert ng["user"].name == "John Doe"
     assert ng["user"].email == "john.doe@example.com"
+
+
+class Embedding:
+    def __init__(self, name, vector):
+        self.name = name
+        self.vector = vector
+
+
+def test_serde_of_pickle_object_out_of_band():
+    pickle.register_type_to_pickle(Embedding)
+    embedding = Embedding(name="doc", vector=np.arange(1024, dtype=np.float64))
+    og = state.State({"embedding": embedding})
+    serialized = og.serialize(pickle_kwargs={"out_of_band": True})
+    assert serialized["embedding"][serde.KEY] == "pickle"
+    assert len(serialized["embedding"]["buffers"]) == 1
+    # the array data lives in the buffer, not in the pickle stream
+    assert len(serialized["embedding"]["value"]) < embedding.vector.nbytes
+    ng = state.State.deserialize(serialized, pickle_kwargs={"out_of_band": True})
+    assert isinstance(ng["embedding"], Embedding)
+    assert ng["embedding"].name == "doc"
+    np.testing.assert_array_equal(ng["embedding"].vector, embedding.vector)
+
+
+def test_serde_of_pickle_object_out_of_band_is_writable():
+    pickle.register_type_to_pickle(Embedding)
+    embedding = Embedding(name="doc", vector=np.arange(16, dtype=np.float64))
+    serialized = state.State({"embedding": embedding}).serialize(
+        pickle_kwargs={"out_of_band": True}
+    )
+    ng = state.State.deserialize(serialized, pickle_kwargs={"out_of_band": True})
+    vector = ng["embedding"].vector
+    assert vector.flags.writeable
+    assert not np.shares_memory(vector, embedding.vector)
+    vector[0] = 5
+    assert embedding.vector[0] == 0
+    # also writable when the buffers come back as immutable bytes (e.g. read from storage)
+    serialized["embedding"]["buffers"] = [bytes(b) for b in serialized["embedding"]["buffers"]]
+    ng = state.State.deserialize(serialized, pickle_kwargs={"out_of_band": True})
+    assert ng["embedding"].vector.flags.writeable
+    np.testing.assert_array_equal(ng["embedding"].vector, np.arange(16, dtype=np.float64))
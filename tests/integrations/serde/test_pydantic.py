@@ -24,3 +24,25 @@ def test_serde_of_pydantic_model():
     assert isinstance(ng["user"], User)
     assert ng["user"].name == "John Doe"
     assert ng["user"].email == "john.doe@example.com"
+
+
+class Settings(BaseModel):
+    name: str
+    retries: int = 3
+    verbose: bool = False
+
+
+def test_serde_of_pydantic_model_exclude_defaults():
+    settings = Settings(name="test", retries=5)
+    og = state.State({"settings": settings})
+    serialized = og.serialize(pydantic_kwargs={"exclude_defaults": True})
+    assert serialized == {
+        "settings": {
+            serde.KEY: "pydantic",
+            "__pydantic_class": "test_pydantic.Settings",
+            "name": "test",
+            "retries": 5,
+        }
+    }
+    ng = state.State.deserialize(serialized)
+    assert ng["settings"] == settings
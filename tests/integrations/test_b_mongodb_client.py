@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from burr.integrations.persisters import b_mongodb
+from burr.integrations.persisters.b_mongodb import MongoDBPersister, close_clients
+
+
+@pytest.fixture
+def mock_mongo_client():
+    with patch.object(b_mongodb, "MongoClient", side_effect=lambda uri: MagicMock()) as m:
+        yield m
+    close_clients()
+
+
+def test_persisters_share_client_per_uri(mock_mongo_client):
+    persister_1 = MongoDBPersister(uri="mongodb://host-a:27017")
+    persister_2 = MongoDBPersister(uri="mongodb://host-a:27017")
+    persister_3 = MongoDBPersister(uri="mongodb://host-b:27017")
+    assert persister_1.client is persister_2.client
+    assert persister_1.client is not persister_3.client
+    assert mock_mongo_client.call_count == 2
+
+
+def test_close_client_evicts_shared_client(mock_mongo_client):
+    persister = MongoDBPersister(uri="mongodb://host-a:27017")
+    client = persister.client
+    persister.close_client()
+    client.close.assert_called_once()
+    # persisters created afterwards get a fresh client rather than the closed one
+    new_persister = MongoDBPersister(uri="mongodb://host-a:27017")
+    assert new_persister.client is not client
+    # closing the stale persister again must not close (or evict) the new client
+    persister.close_client()
+    new_persister.client.close.assert_not_called()
+    assert MongoDBPersister(uri="mongodb://host-a:27017").client is new_persister.client
+
+
+def test_close_clients(mock_mongo_client):
+    clients = [
+        MongoDBPersister(uri=uri).client for uri in ["mongodb://host-a:27017", "mongodb://host-b"]
+    ]
+    close_clients()
+    for client in clients:
+        client.close.assert_called_once()
+    assert b_mongodb._clients == {}
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from burr.integrations.persisters import postgresql
+from burr.integrations.persisters.postgresql import PostgreSQLPersister, close_pools
+
+CONNECTION_ARGS = ("db", "user", "password", "localhost", 5432)
+
+
+@pytest.fixture
+def mock_connect(monkeypatch):
+    # the pool connects through psycopg2.connect as well, so this mocks out every connection
+    monkeypatch.setenv("BURR_PG_POOL", "2")
+    with patch.object(
+        psycopg2, "connect", side_effect=lambda *args, **kwargs: MagicMock(closed=False)
+    ) as m:
+        yield m
+    close_pools()
+
+
+def test_from_values_checks_out_of_shared_pool(mock_connect):
+    persister_1 = PostgreSQLPersister.from_values(*CONNECTION_ARGS)
+    persister_2 = PostgreSQLPersister.from_values(*CONNECTION_ARGS)
+    assert persister_1._pool is not None
+    assert persister_1._pool is persister_2._pool
+    assert persister_1.connection is not persister_2.connection
+
+
+def test_close_returns_connection_to_pool(mock_connect):
+    persister = PostgreSQLPersister.from_values(*CONNECTION_ARGS)
+    connection = persister.connection
+    persister.close()
+    assert persister.connection is None
+    connection.close.assert_not_called()
+    # the returned connection is handed out again
+    assert PostgreSQLPersister.from_values(*CONNECTION_ARGS).connection is connection
+
+
+def test_from_values_falls_back_to_dedicated_connection_when_exhausted(mock_connect):
+    pooled = [PostgreSQLPersister.from_values(*CONNECTION_ARGS) for _ in range(2)]
+    overflow = PostgreSQLPersister.from_values(*CONNECTION_ARGS)
+    assert all(persister._pool is not None for persister in pooled)
+    assert overflow._pool is None
+    connection = overflow.connection
+    overflow.close()
+    connection.close.assert_called_once()
+
+
+def test_close_pools(mock_connect):
+    persister = PostgreSQLPersister.from_values(*CONNECTION_ARGS)
+    pool = persister._pool
+    close_pools()
+    assert pool.closed
+    assert postgresql._pools == {}
+    # closing after the pool is gone closes the connection directly
+    connection = persister.connection
+    persister.close()
+    connection.close.assert_called()
+    assert PostgreSQLPersister.from_values(*CONNECTION_ARGS)._pool is not pool
@@ -0,0 +1,86 @@
+import json
+import math
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from burr.testing import load_test_cases, pytest_generate_tests
+
+
+def _write_test_cases(path, test_cases) -> str:
+    with open(path, "w") as f:
+        json.dump(test_cases, f)
+    return str(path)
+
+
+def test_load_test_cases(tmp_path):
+    file_name = _write_test_cases(
+        tmp_path / "test_cases.json",
+        [
+            {"action": "a", "name": "one", "input_state": {"x": 1}, "expected_state": {"x": 2}},
+            {"action": "b", "name": "two", "input_state": {"x": 3}, "expected_state": {"x": 4}},
+        ],
+    )
+    test_cases, test_ids = load_test_cases(file_name)
+    assert test_cases == [({"x": 1}, {"x": 2}), ({"x": 3}, {"x": 4})]
+    assert test_ids == ["a-one", "b-two"]
+
+
+def test_load_test_cases_missing_keys(tmp_path):
+    file_name = _write_test_cases(
+        tmp_path / "test_cases.json",
+        [
+            {"action": "a", "name": "one", "input_state": {"x": 1}, "expected_state": {"x": 2}},
+            {"input_state": {"x": 3}},
+        ],
+    )
+    test_cases, test_ids = load_test_cases(file_name)
+    assert test_cases == [({"x": 1}, {"x": 2}), ({"x": 3}, None)]
+    assert test_ids == ["a-one", "ACTION_MISSING-NAME_MISSING"]
+
+
+def test_load_test_cases_non_finite_floats(tmp_path):
+    # json.dump (used by `burr test-case create`) writes NaN/Infinity, which strict parsers reject
+    file_name = _write_test_cases(
+        tmp_path / "test_cases.json",
+        [
+            {
+                "action": "a",
+                "name": "one",
+                "input_state": {"x": float("nan")},
+                "expected_state": {"x": float("inf")},
+            }
+        ],
+    )
+    [(input_state, expected_state)], _ = load_test_cases(file_name)
+    assert math.isnan(input_state["x"])
+    assert expected_state["x"] == float("inf")
+
+
+def test_pytest_generate_tests_preserves_file_order(tmp_path):
+    file_names = [
+        _write_test_cases(
+            tmp_path / f"cases_{i}.json",
+            [
+                {
+                    "action": "act",
+                    "name": f"{i}_{j}",
+                    "input_state": {"i": i, "j": j},
+                    "expected_state": {"i": i, "j": j},
+                }
+                for j in range(2)
+            ],
+        )
+        for i in range(3)
+    ]
+    metafunc = MagicMock(fixturenames=["input_state", "expected_state"])
+    metafunc.definition.own_markers = [
+        SimpleNamespace(name="file_name", args=tuple(file_names[:2])),
+        SimpleNamespace(name="other_marker", args=("ignored.json",)),
+        SimpleNamespace(name="file_name", args=(file_names[2],)),
+    ]
+    pytest_generate_tests(metafunc)
+    metafunc.parametrize.assert_called_once_with(
+        "input_state,expected_state",
+        [({"i": i, "j": j}, {"i": i, "j": j}) for i in range(3) for j in range(2)],
+        ids=[f"act-{i}_{j}" for i in range(3) for j in range(2)],
+    )